@@ -62,26 +62,52 @@ class CVDatabase(Database):
         0
 
     """
+    __slots__ = ("_materials_cache",)
+
     from echemdb.cv.cv_entry import CVEntry
 
     Entry = CVEntry
 
-    def materials(self):
+    def __init__(self, data_packages=None):
+        super().__init__(data_packages=data_packages)
+
+        # Memoized value of _materials, built on first access.
+        self._materials_cache = None
+
+    @property
+    def _materials(self):
         r"""
-        Return the substrate materials in the database.
+        Return the working electrode material of each entry in the database.
 
         EXAMPLES::
 
             >>> database = CVDatabase.create_example()
-            >>> database.materials() == {'Cu', 'Ru'}
-            True
+            >>> database._materials
+            ['Ru', 'Cu', 'Cu']
 
         """
-        import pandas as pd
+        if self._materials_cache is None:
+            self._materials_cache = [
+                entry.get_electrode("WE").material for entry in self
+            ]
 
-        return set(
-            pd.unique(pd.Series([entry.get_electrode("WE").material for entry in self]))
-        )
+        return self._materials_cache
+
+    def materials(self):
+        r"""
+        Return the substrate materials in the database, in the order in
+        which they first appear.
+
+        EXAMPLES::
+
+            >>> database = CVDatabase.create_example()
+            >>> database.materials()
+            ['Ru', 'Cu']
+
+        """
+        # The materials are extracted once into a flat list of strings so
+        # that repeated calls do not walk the nested metadata of each entry.
+        return list(dict.fromkeys(self._materials))
 
     def describe(self):
         r"""
@@ -93,14 +119,55 @@ class CVDatabase(Database):
             >>> database.describe() == \
             ... {'number of references': 2,
             ... 'number of entries': 3,
-            ... 'materials': {'Cu', 'Ru'}}
+            ... 'materials': ['Ru', 'Cu']}
             True
 
         """
+        # Count the distinct references in a single pass over the entries;
+        # building the full bibliography just to read its length would parse
+        # and copy all bibliography data.
+        references = {
+            bibliography.key
+            for bibliography in (entry.bibliography for entry in self)
+            if bibliography
+        }
+
         return {
-            "number of references": 0
-            if isinstance(self.bibliography, str)
-            else len(self.bibliography.entries),
+            "number of references": len(references),
             "number of entries": len(self),
             "materials": self.materials(),
         }
+
+    def plot(self, x_label="E", y_label="j"):
+        r"""
+        Return a plot with the curves of all entries in the database.
+
+        The figure is assembled from the plots of the individual entries, so
+        the axis labels, including the reference of the potential axis, are
+        those of the first entry, assuming that all entries share the same
+        units, such as the SI units used throughout the echemdb.
+
+        EXAMPLES::
+
+            >>> database = CVDatabase.create_example()
+            >>> database.plot()
+            Figure(...)
+
+        """
+        entries = list(self)
+
+        if not entries:
+            import plotly.graph_objects
+
+            return plotly.graph_objects.Figure()
+
+        fig = entries[0].plot(
+            x_label=x_label, y_label=y_label, name=entries[0].identifier
+        )
+
+        for entry in entries[1:]:
+            fig.add_traces(
+                entry.plot(x_label=x_label, y_label=y_label, name=entry.identifier).data
+            )
+
+        return fig
@@ -60,6 +60,18 @@ class Database:
         0
 
     """
+    # Databases can be created in large numbers in chained filter()
+    # pipelines, so instances store their packages and lazily built caches
+    # in slots instead of a per-instance __dict__.
+    __slots__ = (
+        "_names",
+        "_packages",
+        "_entries_cache",
+        "_bibliography_cache",
+        "_by_identifier_cache",
+        "_by_source_url_cache",
+    )
+
     from echemdb.entry import Entry
 
     # Entries of this database are created from this type. Subclasses can replace this with a specialized entry type.
@@ -75,7 +87,27 @@ class Database:
                 os.path.join("website-gh-pages", "data", "generated", "svgdigitizer")
             )
 
-        self._packages = data_packages
+        import operator
+
+        # Keep the packages sorted by their identifier. There's a small cost
+        # associated with the sorting but we do not expect to be managing
+        # millions of identifiers and having them show in sorted order is very
+        # convenient, e.g., when doctesting. Sorting once here keeps __iter__
+        # from paying for the sort on every iteration. The identifiers are
+        # extracted once before sorting so that the sort does not reach into
+        # the frictionless resources for every comparison.
+        keyed = [(package.resources[0].name, package) for package in data_packages]
+        keyed.sort(key=operator.itemgetter(0))
+
+        # The identifiers of the packages, parallel to _packages.
+        self._names = [name for name, _ in keyed]
+        self._packages = [package for _, package in keyed]
+
+        # Memoized values of the properties below, built on first access.
+        self._entries_cache = None
+        self._bibliography_cache = None
+        self._by_identifier_cache = None
+        self._by_source_url_cache = None
 
     @classmethod
     def create_example(cls):
@@ -106,6 +138,8 @@ class Database:
         r"""
         Return a pybtex database of all bibtex bibliography files.
 
+        The database is only built on the first access and then cached.
+
         EXAMPLES::
 
             >>> database = Database.create_example()
@@ -124,29 +158,34 @@ class Database:
             ''
 
         """
-        from pybtex.database import BibliographyData
-
-        bib_data = BibliographyData(
-            {
-                entry.bibliography.key: entry.bibliography
-                for entry in self
-                if entry.bibliography
-            }
-        )
+        if self._bibliography_cache is None:
+            from pybtex.database import BibliographyData
+
+            # Read each entry's bibliography only once; the property parses
+            # the entry's bibtex data on every access.
+            bib_data = BibliographyData(
+                {
+                    bibliography.key: bibliography
+                    for bibliography in (entry.bibliography for entry in self)
+                    if bibliography
+                }
+            )
+
+            if isinstance(bib_data, str):
+                return bib_data
 
-        if isinstance(bib_data, str):
-            return bib_data
+            # Remove duplicates from the bibliography
+            bib_data_ = BibliographyData()
 
-        # Remove duplicates from the bibliography
-        bib_data_ = BibliographyData()
+            for key, entry in bib_data.entries.items():
+                if key not in bib_data_.entries:
+                    bib_data_.add_entry(key, entry)
 
-        for key, entry in bib_data.entries.items():
-            if key not in bib_data_.entries:
-                bib_data_.add_entry(key, entry)
+            self._bibliography_cache = bib_data_
 
-        return bib_data_
+        return self._bibliography_cache
 
-    def filter(self, predicate):
+    def filter(self, predicate, workers=None):
         r"""
         Return the subset of the database that satisfies predicate.
 
@@ -164,6 +203,13 @@ class Database:
             >>> database.filter(lambda entry: entry.non.existing.property)
             []
 
+        Expensive predicates, e.g., predicates that load data or query
+        remote servers, can be evaluated in a thread pool by setting
+        ``workers``; the order of the entries is preserved::
+
+            >>> database.filter(lambda entry: entry.source.url == 'https://doi.org/10.1039/C0CP01001D', workers=2)
+            [Entry('alves_2011_electrochemistry_6010_f1a_solid')]
+
         """
 
         def catching_predicate(entry):
@@ -173,9 +219,19 @@ class Database:
                 logger.debug(f"Filter removed entry {entry} due to error: {e}")
                 return False
 
+        entries = list(self)
+
+        if workers is None:
+            selected = [catching_predicate(entry) for entry in entries]
+        else:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                selected = list(executor.map(catching_predicate, entries))
+
         return type(self)(
             data_packages=[
-                entry.package for entry in self if catching_predicate(entry)
+                entry.package for entry, keep in zip(entries, selected) if keep
             ],
         )
 
@@ -190,16 +246,15 @@ class Database:
             Entry('alves_2011_electrochemistry_6010_f1a_solid')
 
         """
-        # Return the entries sorted by their identifier. There's a small cost
-        # associated with the sorting but we do not expect to be managing
-        # millions of identifiers and having them show in sorted order is very
-        # convenient, e.g., when doctesting.
-        return iter(
-            [
-                self.Entry(package)
-                for package in sorted(self._packages, key=lambda p: p.resources[0].name)
-            ]
-        )
+        # Return the entries sorted by their identifier; the packages are
+        # kept sorted by __init__. Since the set of packages does not change
+        # after construction, the entries are only built on the first
+        # iteration and then reused, e.g., by __getitem__ and __repr__ which
+        # iterate separately.
+        if self._entries_cache is None:
+            self._entries_cache = [self.Entry(package) for package in self._packages]
+
+        return iter(self._entries_cache)
 
     def __len__(self):
         r"""
@@ -226,6 +281,38 @@ class Database:
         """
         return repr(list(self))
 
+    @property
+    def _by_identifier(self):
+        r"""
+        Return a dict mapping identifiers to the entries of this database.
+
+        EXAMPLES::
+
+            >>> database = Database.create_example()
+            >>> database._by_identifier # doctest: +NORMALIZE_WHITESPACE
+            {'alves_2011_electrochemistry_6010_f1a_solid': Entry('alves_2011_electrochemistry_6010_f1a_solid'),
+             'engstfeld_2018_polycrystalline_17743_f4b_1': Entry('engstfeld_2018_polycrystalline_17743_f4b_1'),
+             'no_bibliography': Entry('no_bibliography')}
+
+        """
+        if self._by_identifier_cache is None:
+            entries = list(self)
+            index = {entry.identifier: entry for entry in entries}
+
+            if len(index) != len(entries):
+                duplicates = [
+                    identifier
+                    for identifier in index
+                    if sum(entry.identifier == identifier for entry in entries) > 1
+                ]
+                raise KeyError(
+                    f"The database has more than one entry with identifier '{duplicates[0]}'."
+                )
+
+            self._by_identifier_cache = index
+
+        return self._by_identifier_cache
+
     def __getitem__(self, identifier):
         r"""
         Return the entry with this identifier.
@@ -242,12 +329,124 @@ class Database:
             KeyError: "No database entry with identifier 'invalid_key'."
 
         """
-        entries = [entry for entry in self if entry.identifier == identifier]
-
-        if len(entries) == 0:
-            raise KeyError(f"No database entry with identifier '{identifier}'.")
-        if len(entries) > 1:
+        # Build the index outside the try block below so that errors raised
+        # while building it, such as a duplicate identifier, are not
+        # misreported as a missing entry.
+        index = self._by_identifier
+
+        try:
+            return index[identifier]
+        except KeyError:
             raise KeyError(
-                f"The database has more than one entry with identifier '{identifier}'."
-            )
-        return entries[0]
+                f"No database entry with identifier '{identifier}'."
+            ) from None
+
+    def __contains__(self, identifier):
+        r"""
+        Return whether the database contains an entry with this identifier.
+
+        EXAMPLES::
+
+            >>> database = Database.create_example()
+            >>> 'alves_2011_electrochemistry_6010_f1a_solid' in database
+            True
+            >>> 'invalid_key' in database
+            False
+
+        """
+        try:
+            return identifier in self._by_identifier
+        except KeyError:
+            # The index cannot be built, e.g., because an identifier is
+            # duplicated; a membership test should not raise, so fall back to
+            # scanning the identifiers.
+            return identifier in self._names
+
+    def get_many(self, identifiers):
+        r"""
+        Return the entries with these identifiers.
+
+        EXAMPLES::
+
+            >>> database = Database.create_example()
+            >>> database.get_many(['no_bibliography', 'alves_2011_electrochemistry_6010_f1a_solid'])
+            [Entry('no_bibliography'), Entry('alves_2011_electrochemistry_6010_f1a_solid')]
+
+        """
+        index = self._by_identifier
+        try:
+            return [index[identifier] for identifier in identifiers]
+        except KeyError as e:
+            raise KeyError(f"No database entry with identifier {e}.") from None
+
+    @property
+    def _by_source_url(self):
+        r"""
+        Return a dict mapping source URLs to the entries of this database.
+
+        EXAMPLES::
+
+            >>> database = Database.create_example()
+            >>> database._by_source_url['https://doi.org/10.1039/C0CP01001D']
+            [Entry('alves_2011_electrochemistry_6010_f1a_solid')]
+
+        """
+        if self._by_source_url_cache is None:
+            index = {}
+
+            for entry in self:
+                try:
+                    url = entry.source.url
+                except (KeyError, AttributeError):
+                    continue
+                index.setdefault(url, []).append(entry)
+
+            self._by_source_url_cache = index
+
+        return self._by_source_url_cache
+
+    def filter_by_source_url(self, url):
+        r"""
+        Return the subset of the database with entries from this source URL.
+
+        Equivalent to ``filter(lambda entry: entry.source.url == url)`` but
+        served from a precomputed index instead of checking every entry.
+
+        EXAMPLES::
+
+            >>> database = Database.create_example()
+            >>> database.filter_by_source_url('https://doi.org/10.1039/C0CP01001D')
+            [Entry('alves_2011_electrochemistry_6010_f1a_solid')]
+
+            >>> database.filter_by_source_url('https://doi.org/invalid')
+            []
+
+        """
+        return type(self)(
+            data_packages=[entry.package for entry in self._by_source_url.get(url, [])],
+        )
+
+    def filter_by_identifiers(self, identifiers):
+        r"""
+        Return the subset of the database with entries with these identifiers.
+
+        Preferred over ``filter(lambda entry: entry.identifier in identifiers)``
+        since it uses the identifier index instead of checking every entry.
+        Identifiers without an entry in the database are ignored.
+
+        EXAMPLES::
+
+            >>> database = Database.create_example()
+            >>> database.filter_by_identifiers(['no_bibliography', 'invalid_key'])
+            [Entry('no_bibliography')]
+
+        """
+        index = self._by_identifier
+
+        return type(self)(
+            data_packages=[
+                index[identifier].package
+                for identifier in identifiers
+                if identifier in index
+            ],
+        )
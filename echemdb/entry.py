@@ -50,11 +50,20 @@ also contain information on the source of the data.::
 # ********************************************************************
 import logging
 import os.path
+import weakref
 
 from echemdb.descriptor import Descriptor
 
 logger = logging.getLogger("echemdb")
 
+# Parsed bibliographies, keyed by the id of the underlying data package.
+# Packages are shared between databases, e.g., a database and its filtered
+# subsets, so the cache lives at module level and outlives the individual
+# Entry objects. Frictionless packages define __eq__ without __hash__ and can
+# therefore not key a WeakKeyDictionary; instead we key by id and evict the
+# cached value when its package is garbage collected.
+_bibliography_cache = {}
+
 
 class Entry:
     r"""
@@ -181,18 +190,38 @@ class Entry:
             >>> entry_no_bib.bibliography
             ''
 
+        TESTS:
+
+        The parsed bibliography is cached on the underlying data package, so
+        entries wrapping the same package share a single parse::
+
+            >>> entry = Entry.create_examples()[0]
+            >>> entry.bibliography is Entry(entry.package).bibliography
+            True
+
         """
+        key = id(self.package)
+
+        if key in _bibliography_cache:
+            return _bibliography_cache[key]
+
         metadata = self._metadata.setdefault("source", {})
         citation = metadata.setdefault("bibdata", "")
 
         if not citation:
             logger.warning(f"Entry with name {self.identifier} has no bibliography.")
-            return citation
+            bibliography = citation
+        else:
+            from pybtex.database import parse_string
+
+            bibliography = parse_string(citation, "bibtex").entries[
+                self.source.citation_key
+            ]
 
-        from pybtex.database import parse_string
+        _bibliography_cache[key] = bibliography
+        weakref.finalize(self.package, _bibliography_cache.pop, key, None)
 
-        bibliography = parse_string(citation, "bibtex")
-        return bibliography.entries[self.source.citation_key]
+        return bibliography
 
     def citation(self, backend="text"):
         r"""